@@ -1,5 +1,9 @@
 """Initial schema.
 
+Non-transactional: tables are created in the migration transaction, then
+secondary indexes are built with CREATE INDEX CONCURRENTLY inside an
+autocommit block (CONCURRENTLY cannot run in a transaction).
+
 Revision ID: 001
 Revises:
 Create Date: 2025-01-01 00:00:00.000000
@@ -16,6 +20,11 @@ branch_labels = None
 depends_on = None
 
 
+def _utc_now():
+    """Current time as naive UTC, independent of the session TimeZone."""
+    return sa.func.timezone("UTC", sa.func.now())
+
+
 def upgrade() -> None:
     # Users
     op.create_table(
@@ -24,8 +33,8 @@ def upgrade() -> None:
         sa.Column("email", sa.String(255), unique=True, nullable=False, index=True),
         sa.Column("username", sa.String(100), unique=True, nullable=False),
         sa.Column("hashed_password", sa.String(255), nullable=False),
-        sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime, server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime, server_default=_utc_now()),
+        sa.Column("updated_at", sa.DateTime, server_default=_utc_now()),
     )
 
     # Books
@@ -41,9 +50,26 @@ def upgrade() -> None:
         sa.Column("summary", sa.Text, nullable=True),
         sa.Column("review_consensus", sa.Text, nullable=True),
         sa.Column("consensus_version", sa.Integer, server_default="0"),
-        sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime, server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime, server_default=_utc_now()),
+        sa.Column("updated_at", sa.DateTime, server_default=_utc_now()),
+    )
+
+    # updated_at is maintained by the database, not the ORM
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = timezone('UTC', now());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
     )
+    for table in ("users", "books"):
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
 
     # Borrows
     op.create_table(
@@ -61,17 +87,9 @@ def upgrade() -> None:
             sa.ForeignKey("books.id", ondelete="CASCADE"),
             nullable=False,
         ),
-        sa.Column("borrowed_at", sa.DateTime, server_default=sa.func.now()),
+        sa.Column("borrowed_at", sa.DateTime, server_default=_utc_now()),
         sa.Column("returned_at", sa.DateTime, nullable=True),
     )
-    # Partial unique index: one active borrow per user per book
-    op.create_index(
-        "ix_active_borrow",
-        "borrows",
-        ["user_id", "book_id"],
-        unique=True,
-        postgresql_where=sa.text("returned_at IS NULL"),
-    )
 
     # Reviews
     op.create_table(
@@ -91,9 +109,8 @@ def upgrade() -> None:
         ),
         sa.Column("rating", sa.Integer, nullable=False),
         sa.Column("text", sa.Text, nullable=False),
-        sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime, server_default=_utc_now()),
     )
-    op.create_index("ix_reviews_book", "reviews", ["book_id"])
 
     # User Preferences (explicit)
     op.create_table(
@@ -131,10 +148,72 @@ def upgrade() -> None:
         ),
         sa.Column("interaction_type", interaction_type, nullable=False),
         sa.Column("rating", sa.Float, nullable=True),
-        sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime, server_default=_utc_now()),
     )
-    op.create_index("ix_interactions_user", "user_interactions", ["user_id"])
-    op.create_index("ix_interactions_book", "user_interactions", ["book_id"])
+
+    # Secondary indexes — built CONCURRENTLY outside the DDL transaction so
+    # they never hold a write lock on the table while they build.
+    with op.get_context().autocommit_block():
+        # Partial unique index: one active borrow per user per book
+        op.create_index(
+            "ix_active_borrow",
+            "borrows",
+            ["user_id", "book_id"],
+            unique=True,
+            postgresql_where=sa.text("returned_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+        # Partial index: a user's currently borrowed books
+        op.create_index(
+            "ix_borrows_active_by_user",
+            "borrows",
+            ["user_id", "borrowed_at"],
+            postgresql_where=sa.text("returned_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+        # Any borrow (active or returned) by a user of a book, for the
+        # review-eligibility EXISTS probe
+        op.create_index(
+            "ix_borrows_user_book",
+            "borrows",
+            ["user_id", "book_id"],
+            postgresql_concurrently=True,
+        )
+        # GIN index for genre-overlap (genres && :prefs) candidate filtering
+        op.create_index(
+            "ix_books_genres_gin",
+            "books",
+            ["genres"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        # Covers per-book rating aggregates with an index-only scan
+        op.create_index(
+            "ix_reviews_book_rating",
+            "reviews",
+            ["book_id", "rating"],
+            postgresql_concurrently=True,
+        )
+        # Serves newest-first (created_at, id) keyset pagination of a book's reviews
+        op.create_index(
+            "ix_reviews_book_created",
+            "reviews",
+            ["book_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        # Serves "latest N interactions for a user" as an index-ordered scan
+        op.create_index(
+            "ix_interactions_user_time",
+            "user_interactions",
+            ["user_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_interactions_book",
+            "user_interactions",
+            ["book_id"],
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
@@ -142,7 +221,11 @@ def downgrade() -> None:
     op.execute("DROP TYPE IF EXISTS interaction_type_enum")
     op.drop_table("user_preferences")
     op.drop_table("reviews")
+    op.drop_index("ix_borrows_user_book", table_name="borrows")
+    op.drop_index("ix_borrows_active_by_user", table_name="borrows")
     op.drop_index("ix_active_borrow", table_name="borrows")
     op.drop_table("borrows")
     op.drop_table("books")
-    op.drop_table("users")alembic/versions/001_initial_schema.py
+    op.drop_table("users")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+
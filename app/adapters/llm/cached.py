@@ -0,0 +1,135 @@
+"""Caching decorator for any LLMPort implementation."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from cachetools import TTLCache
+
+from app.ports.llm import LLMPort
+from app.prompts.templates import (
+    ANALYZE_REVIEWS,
+    MERGE_REVIEW_CONSENSUS,
+    REVIEW_CHUNK_MAX_TOKENS,
+    SUMMARIZE_BOOK,
+    PromptTemplate,
+)
+
+logger = logging.getLogger(__name__)
+
+# Module-level so every wrapper in the process shares one cache, however
+# get_llm() builds them; namespaces keep providers/models apart
+_response_cache: TTLCache = TTLCache(maxsize=1024, ttl=86400)
+# In-flight LLM calls by cache key, so concurrent identical requests share one
+_inflight: dict[str, asyncio.Future[str]] = {}
+
+
+def _finish_inflight(key: str, task: asyncio.Future[str]) -> None:
+    """
+    Drop a finished call from the in-flight map and retrieve its outcome.
+
+    If every waiter was cancelled before the call failed, nobody else reads
+    the exception and asyncio would log "Task exception was never retrieved".
+    Waiters still awaiting the call get the exception as usual.
+    """
+    _inflight.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("LLM call failed: %r", task.exception())
+
+
+class CachedLLMAdapter(LLMPort):
+    """
+    Wraps another LLM adapter and memoizes its responses in-process.
+
+    Keys combine a namespace (provider/model), the name and version of every
+    prompt template that shapes the result, and a hash of the exact input,
+    so retried or re-queued tasks for unchanged content skip the LLM call and
+    bumping any of those template versions invalidates old entries.
+    """
+
+    def __init__(
+        self,
+        inner: LLMPort,
+        namespace: str,
+        cache: TTLCache | None = None,
+    ) -> None:
+        self._inner = inner
+        self._namespace = namespace
+        self._cache = _response_cache if cache is None else cache
+
+    def _key(self, templates: tuple[PromptTemplate, ...], payload: str) -> str:
+        """Build a compact cache key for the templates behind a result + its input."""
+        digest = hashlib.blake2b(digest_size=16)
+        parts = [self._namespace]
+        for template in templates:
+            parts += (template.name, template.version)
+        parts.append(payload)
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    async def summarize_book(self, text: str) -> str:
+        """Return a cached summary, or generate and cache one."""
+        key = self._key((SUMMARIZE_BOOK,), text)
+        return await self._get_or_generate(
+            key, "summarize_book", lambda: self._inner.summarize_book(text)
+        )
+
+    async def analyze_reviews(
+        self, reviews: list[dict], current_consensus: str | None
+    ) -> str:
+        """Return a cached consensus, or generate and cache one."""
+        # Large review sets are map-reduced, so the merge prompt and the
+        # per-chunk budget shape the result too
+        payload = json.dumps(
+            [reviews, current_consensus, REVIEW_CHUNK_MAX_TOKENS],
+            sort_keys=True,
+            default=str,
+        )
+        key = self._key((ANALYZE_REVIEWS, MERGE_REVIEW_CONSENSUS), payload)
+        return await self._get_or_generate(
+            key,
+            "analyze_reviews",
+            lambda: self._inner.analyze_reviews(reviews, current_consensus),
+        )
+
+    async def _get_or_generate(
+        self, key: str, label: str, generate: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        Serve from cache, join an identical in-flight call, or start one.
+
+        Coalescing means a burst of identical requests (e.g. many consensus
+        tasks for one book after a bulk event) pays for a single LLM call.
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.info("LLM cache hit: %s", label)
+            return cached
+
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_and_store(key, generate))
+            _inflight[key] = task
+            task.add_done_callback(partial(_finish_inflight, key))
+        else:
+            logger.info("LLM request coalesced: %s", label)
+        # Shield so one cancelled caller doesn't cancel the call for the others
+        return await asyncio.shield(task)
+
+    async def _generate_and_store(
+        self, key: str, generate: Callable[[], Awaitable[str]]
+    ) -> str:
+        result = await generate()
+        self._cache[key] = result
+        return result
+
+    async def aclose(self) -> None:
+        """Close the wrapped adapter, if it holds resources."""
+        close = getattr(self._inner, "aclose", None)
+        if close is not None:
+            await close()
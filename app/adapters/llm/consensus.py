@@ -0,0 +1,78 @@
+"""Map-reduce review consensus shared by the LLM adapters."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from app.prompts.templates import (
+    ANALYZE_REVIEWS,
+    MERGE_REVIEW_CONSENSUS,
+    REVIEW_CHUNK_MAX_TOKENS,
+    chunk_partials,
+    chunk_reviews,
+    render_consensus_merge_prompt,
+    render_review_consensus_prompt,
+)
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on in-flight chunk requests when map-reducing large review sets
+MAX_CONCURRENT_CHUNKS = 4
+
+# An adapter's completion call: (system, user, max_tokens) -> text
+Generate = Callable[[str, str, int], Awaitable[str]]
+
+
+async def analyze_reviews_map_reduce(
+    generate: Generate,
+    reviews: list[dict],
+    current_consensus: str | None,
+) -> str:
+    """
+    Generate/update a review consensus, map-reducing large review sets.
+
+    Each batch of reviews gets a partial consensus. Partials are merged in
+    rounds, each group sized to fit one merge prompt, until a single merge
+    covers them all, so no review batch is ever truncated away. Only the
+    final merge sees the previous consensus.
+    """
+    chunks = chunk_reviews(reviews)
+    if len(chunks) <= 1:
+        prompt = render_review_consensus_prompt(reviews, current_consensus)
+        return await generate(
+            prompt["system"], prompt["user"], ANALYZE_REVIEWS.max_tokens
+        )
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+
+    async def bounded(prompt: dict[str, str], max_tokens: int) -> str:
+        async with semaphore:
+            return await generate(prompt["system"], prompt["user"], max_tokens)
+
+    partials = await asyncio.gather(
+        *(
+            bounded(render_review_consensus_prompt(chunk), REVIEW_CHUNK_MAX_TOKENS)
+            for chunk in chunks
+        )
+    )
+
+    groups = chunk_partials(partials)
+    while len(groups) > 1:
+        if len(groups) == len(partials):
+            raise ValueError("Partial consensuses are too long to merge")
+        logger.info(
+            "Merging %d partial consensuses in %d groups", len(partials), len(groups)
+        )
+        partials = await asyncio.gather(
+            *(
+                bounded(render_consensus_merge_prompt(group), REVIEW_CHUNK_MAX_TOKENS)
+                for group in groups
+            )
+        )
+        groups = chunk_partials(partials)
+
+    logger.info("Merging %d partial consensuses", len(partials))
+    prompt = render_consensus_merge_prompt(partials, current_consensus)
+    return await generate(
+        prompt["system"], prompt["user"], MERGE_REVIEW_CONSENSUS.max_tokens
+    )
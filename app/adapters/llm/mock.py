@@ -1,11 +1,22 @@
 import asyncio
 import logging
+from bisect import bisect_right
+from statistics import fmean
 
 from app.ports.llm import LLMPort
 from app.prompts.templates import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Average-rating thresholds and the sentiment for each band between them
+_SENTIMENT_THRESHOLDS = (2.0, 3.0, 4.0)
+_SENTIMENTS = (
+    "predominantly critical",
+    "mixed, with both praise and criticism",
+    "generally positive with some reservations",
+    "overwhelmingly positive",
+)
+
 
 class MockLLMAdapter(LLMPort):
     """
@@ -41,16 +52,8 @@ class MockLLMAdapter(LLMPort):
         """Return a mock review consensus."""
         await asyncio.sleep(0.3)  # simulate LLM latency
         count = len(reviews)
-        avg = sum(r["rating"] for r in reviews) / count if count else 0.0
-
-        if avg >= 4.0:
-            sentiment = "overwhelmingly positive"
-        elif avg >= 3.0:
-            sentiment = "generally positive with some reservations"
-        elif avg >= 2.0:
-            sentiment = "mixed, with both praise and criticism"
-        else:
-            sentiment = "predominantly critical"
+        avg = fmean(r["rating"] for r in reviews) if count else 0.0
+        sentiment = _SENTIMENTS[bisect_right(_SENTIMENT_THRESHOLDS, avg)]
 
         logger.info(
             "MockLLM: analyze_reviews called (%d reviews, avg=%.1f)", count, avg
@@ -2,12 +2,11 @@ import logging
 
 import httpx
 
+from app.adapters.llm.consensus import analyze_reviews_map_reduce
 from app.ports.llm import LLMPort
 from app.prompts.templates import (
-    ANALYZE_REVIEWS,
     SUMMARIZE_BOOK,
     render_book_summary_prompt,
-    render_review_consensus_prompt,
 )
 
 logger = logging.getLogger(__name__)
@@ -19,6 +18,22 @@ class OllamaLLMAdapter(LLMPort):
     def __init__(self, base_url: str, model: str) -> None:
         self._base_url = base_url.rstrip("/")
         self._model = model
+        # One client per adapter so keep-alive connections are reused across calls;
+        # the DI container shares one adapter per process (get_shared_adapter).
+        # Generation is slow, so only the read timeout is long; connection setup
+        # fails fast and is retried by the transport (safe: nothing was sent).
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(connect=5.0, read=180.0, write=10.0, pool=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its connection pool."""
+        await self._client.aclose()
 
     async def _generate(self, system: str, user: str, max_tokens: int) -> str:
         """Send a chat completion request to Ollama."""
@@ -31,13 +46,12 @@ class OllamaLLMAdapter(LLMPort):
             "stream": False,
             "options": {"num_predict": max_tokens},
         }
-        async with httpx.AsyncClient(timeout=180.0) as client:
-            logger.info("Ollama request: model=%s, max_tokens=%d", self._model, max_tokens)
-            resp = await client.post(f"{self._base_url}/api/chat", json=payload)
-            resp.raise_for_status()
-            result = resp.json()["message"]["content"]
-            logger.info("Ollama response: %d chars", len(result))
-            return result
+        logger.info("Ollama request: model=%s, max_tokens=%d", self._model, max_tokens)
+        resp = await self._client.post("/api/chat", json=payload)
+        resp.raise_for_status()
+        result = resp.json()["message"]["content"]
+        logger.info("Ollama response: %d chars", len(result))
+        return result
 
     async def summarize_book(self, text: str) -> str:
         """Generate a book summary via Ollama."""
@@ -49,8 +63,7 @@ class OllamaLLMAdapter(LLMPort):
     async def analyze_reviews(
         self, reviews: list[dict], current_consensus: str | None
     ) -> str:
-        """Generate/update review consensus via Ollama."""
-        prompt = render_review_consensus_prompt(reviews, current_consensus)
-        return await self._generate(
-            prompt["system"], prompt["user"], ANALYZE_REVIEWS.max_tokens
+        """Generate/update review consensus via Ollama, map-reducing large review sets."""
+        return await analyze_reviews_map_reduce(
+            self._generate, reviews, current_consensus
         )
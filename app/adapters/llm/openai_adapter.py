@@ -1,13 +1,13 @@
 import logging
 
+import httpx
 from openai import AsyncOpenAI
 
+from app.adapters.llm.consensus import analyze_reviews_map_reduce
 from app.ports.llm import LLMPort
 from app.prompts.templates import (
-    ANALYZE_REVIEWS,
     SUMMARIZE_BOOK,
     render_book_summary_prompt,
-    render_review_consensus_prompt,
 )
 
 logger = logging.getLogger(__name__)
@@ -17,9 +17,20 @@ class OpenAILLMAdapter(LLMPort):
     """LLM adapter using OpenAI API (GPT-4o, GPT-4o-mini, etc.)."""
 
     def __init__(self, api_key: str, model: str) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+        # Bounded retries and a finite timeout keep transient 5xx from stalling
+        # a task for minutes (the SDK default timeout is 600s). The DI container
+        # shares one adapter, and so one client, per process (get_shared_adapter).
+        self._client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=2,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
         self._model = model
 
+    async def aclose(self) -> None:
+        """Close the underlying OpenAI HTTP client."""
+        await self._client.close()
+
     async def _generate(self, system: str, user: str, max_tokens: int) -> str:
         """Send a chat completion request to OpenAI."""
         logger.info("OpenAI request: model=%s, max_tokens=%d", self._model, max_tokens)
@@ -46,8 +57,7 @@ class OpenAILLMAdapter(LLMPort):
     async def analyze_reviews(
         self, reviews: list[dict], current_consensus: str | None
     ) -> str:
-        """Generate/update review consensus via OpenAI."""
-        prompt = render_review_consensus_prompt(reviews, current_consensus)
-        return await self._generate(
-            prompt["system"], prompt["user"], ANALYZE_REVIEWS.max_tokens
+        """Generate/update review consensus via OpenAI, map-reducing large review sets."""
+        return await analyze_reviews_map_reduce(
+            self._generate, reviews, current_consensus
         )
@@ -0,0 +1,41 @@
+"""Process-wide adapter instances, shared across requests and closed on shutdown."""
+
+import logging
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_A = TypeVar("_A")
+
+# Keyed by adapter class + constructor arguments
+_instances: dict[tuple, Any] = {}
+
+
+def get_shared_adapter(adapter_cls: Callable[..., _A], **kwargs: Any) -> _A:
+    """
+    Return the process-wide adapter for these settings, creating it on first use.
+
+    Network adapters own connection pools (httpx, aiohttp under aioboto3), so
+    building one per request would open a pool per request and never reuse
+    or close it.
+    """
+    key = (adapter_cls, tuple(sorted(kwargs.items())))
+    adapter = _instances.get(key)
+    if adapter is None:
+        adapter = _instances[key] = adapter_cls(**kwargs)
+    return adapter
+
+
+async def close_shared_adapters() -> None:
+    """Close every shared adapter that holds resources. Called on app shutdown."""
+    adapters = list(_instances.values())
+    _instances.clear()
+    for adapter in adapters:
+        close = getattr(adapter, "aclose", None)
+        if close is None:
+            continue
+        try:
+            await close()
+        except Exception:
+            logger.exception("Failed to close %s", type(adapter).__name__)
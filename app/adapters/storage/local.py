@@ -2,6 +2,7 @@
 """Local filesystem storage adapter."""
 
 import logging
+from collections.abc import AsyncIterable
 from pathlib import Path
 from uuid import UUID
 
@@ -21,13 +22,22 @@ class LocalStorageAdapter(StoragePort):
         self._base.mkdir(parents=True, exist_ok=True)
         logger.info("LocalStorage initialized at: %s", self._base.resolve())
 
-    async def save(self, file_id: UUID, content: bytes, extension: str) -> str:
-        """Save file to local disk. Returns absolute path."""
+    async def save(
+        self, file_id: UUID, content: bytes | AsyncIterable[bytes], extension: str
+    ) -> str:
+        """Save file to local disk, streaming chunks if given an iterable. Returns absolute path."""
         filename = f"{file_id}.{extension}"
         filepath = self._base / filename
+        size = 0
         async with aiofiles.open(filepath, "wb") as f:
-            await f.write(content)
-        logger.info("Saved file: %s (%d bytes)", filename, len(content))
+            if isinstance(content, bytes):
+                await f.write(content)
+                size = len(content)
+            else:
+                async for chunk in content:
+                    await f.write(chunk)
+                    size += len(chunk)
+        logger.info("Saved file: %s (%d bytes)", filename, size)
         return str(filepath)
 
     async def read(self, path: str) -> bytes:
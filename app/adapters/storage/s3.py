@@ -2,16 +2,21 @@
 
 import asyncio
 import logging
-from functools import partial
+from collections.abc import AsyncIterable
+from contextlib import AsyncExitStack
+from typing import Any
 from uuid import UUID
 
-import boto3
+import aioboto3
 from botocore.exceptions import ClientError
 
 from app.ports.storage import StoragePort
 
 logger = logging.getLogger(__name__)
 
+# Part size for streamed uploads (S3 requires at least 5 MiB for all but the last part)
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 class S3StorageAdapter(StoragePort):
     """Store book files in S3-compatible object storage."""
@@ -23,60 +28,139 @@ class S3StorageAdapter(StoragePort):
         secret_key: str,
         bucket: str,
     ) -> None:
-        self._client = boto3.client(
-            "s3",
-            endpoint_url=endpoint_url,
+        self._session = aioboto3.Session(
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
         )
+        self._endpoint_url = endpoint_url
         self._bucket = bucket
-        self._ensure_bucket()
+        self._client: Any = None
+        self._client_lock = asyncio.Lock()
+        self._exit_stack = AsyncExitStack()
         logger.info("S3Storage initialized: bucket=%s, endpoint=%s", bucket, endpoint_url)
 
-    def _ensure_bucket(self) -> None:
+    async def _get_client(self) -> Any:
+        """Open the shared async S3 client on first use."""
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    # Closes the client again if the bucket check fails, so
+                    # the next call starts clean instead of leaking a session
+                    async with AsyncExitStack() as stack:
+                        client = await stack.enter_async_context(
+                            self._session.client("s3", endpoint_url=self._endpoint_url)
+                        )
+                        await self._ensure_bucket(client)
+                        self._exit_stack = stack.pop_all()
+                    self._client = client
+        return self._client
+
+    async def _ensure_bucket(self, client: Any) -> None:
         """Create the bucket if it doesn't exist."""
         try:
-            self._client.head_bucket(Bucket=self._bucket)
+            await client.head_bucket(Bucket=self._bucket)
         except ClientError:
-            self._client.create_bucket(Bucket=self._bucket)
+            await client.create_bucket(Bucket=self._bucket)
             logger.info("Created S3 bucket: %s", self._bucket)
 
-    async def save(self, file_id: UUID, content: bytes, extension: str) -> str:
-        """Upload file to S3. Returns the object key."""
+    async def aclose(self) -> None:
+        """Close the shared S3 client and its connection pool."""
+        await self._exit_stack.aclose()
+        self._client = None
+
+    async def save(
+        self, file_id: UUID, content: bytes | AsyncIterable[bytes], extension: str
+    ) -> str:
+        """Upload file to S3, streaming chunks if given an iterable. Returns the object key."""
         key = f"books/{file_id}.{extension}"
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            partial(
-                self._client.put_object,
+        client = await self._get_client()
+        if isinstance(content, bytes):
+            await client.put_object(Bucket=self._bucket, Key=key, Body=content)
+            size = len(content)
+        else:
+            size = await self._upload_stream(client, key, content)
+        logger.info("Uploaded to S3: %s (%d bytes)", key, size)
+        return key
+
+    async def _upload_stream(
+        self, client: Any, key: str, stream: AsyncIterable[bytes]
+    ) -> int:
+        """
+        Upload a byte stream, holding at most one part in memory.
+
+        Streams that fit in a single part are sent with one put_object;
+        larger ones switch to a multipart upload, aborted on failure.
+        """
+        buffer = bytearray()
+        parts: list[dict[str, Any]] = []
+        upload_id: str | None = None
+        size = 0
+        try:
+            async for chunk in stream:
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) < MULTIPART_CHUNK_SIZE:
+                    continue
+                if upload_id is None:
+                    upload = await client.create_multipart_upload(
+                        Bucket=self._bucket, Key=key
+                    )
+                    upload_id = upload["UploadId"]
+                await self._upload_part(client, key, upload_id, parts, bytes(buffer))
+                buffer.clear()
+
+            if upload_id is None:
+                await client.put_object(Bucket=self._bucket, Key=key, Body=bytes(buffer))
+                return size
+
+            if buffer:
+                await self._upload_part(client, key, upload_id, parts, bytes(buffer))
+            await client.complete_multipart_upload(
                 Bucket=self._bucket,
                 Key=key,
-                Body=content,
-            ),
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            # BaseException: a cancelled request (client disconnect) must
+            # abort too, or the uploaded parts are billed until expired
+            if upload_id is not None:
+                await client.abort_multipart_upload(
+                    Bucket=self._bucket, Key=key, UploadId=upload_id
+                )
+            raise
+        return size
+
+    async def _upload_part(
+        self,
+        client: Any,
+        key: str,
+        upload_id: str,
+        parts: list[dict[str, Any]],
+        body: bytes,
+    ) -> None:
+        """Upload the next part of a multipart upload and record its ETag."""
+        part_number = len(parts) + 1
+        resp = await client.upload_part(
+            Bucket=self._bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
         )
-        logger.info("Uploaded to S3: %s (%d bytes)", key, len(content))
-        return key
+        parts.append({"ETag": resp["ETag"], "PartNumber": part_number})
 
     async def read(self, path: str) -> bytes:
         """Download file from S3."""
-        loop = asyncio.get_event_loop()
-        resp = await loop.run_in_executor(
-            None,
-            partial(self._client.get_object, Bucket=self._bucket, Key=path),
-        )
-        content = resp["Body"].read()
+        client = await self._get_client()
+        resp = await client.get_object(Bucket=self._bucket, Key=path)
+        async with resp["Body"] as body:
+            content = await body.read()
         logger.debug("Downloaded from S3: %s (%d bytes)", path, len(content))
         return content
 
     async def delete(self, path: str) -> None:
         """Delete file from S3."""
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            partial(
-                self._client.delete_object,
-                Bucket=self._bucket,
-                Key=path,
-            ),
-        )
+        client = await self._get_client()
+        await client.delete_object(Bucket=self._bucket, Key=path)
         logger.info("Deleted from S3: %s", path)
@@ -4,7 +4,9 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.adapters.recommender.hybrid import HybridRecommenderAdapter
 from app.api.middleware.auth import get_current_user
@@ -29,18 +31,22 @@ async def get_analysis(
     _user: User = Depends(get_current_user),
 ) -> AnalysisResponse:
     """Get GenAI-aggregated summary of all reviews for a book."""
-    result = await session.execute(select(Book).where(Book.id == book_id))
-    book = result.scalar_one_or_none()
-    if not book:
-        raise HTTPException(status_code=404, detail="Book not found")
-
-    stats = await session.execute(
+    result = await session.execute(
         select(
-            func.count(Review.id).label("total"),
+            Book,
+            # count(rating) rather than count(id): rating is NOT NULL and is
+            # in ix_reviews_book_rating, so the aggregate stays index-only
+            func.count(Review.rating).label("total"),
             func.avg(Review.rating).label("avg_rating"),
-        ).where(Review.book_id == book_id)
+        )
+        .outerjoin(Review, Review.book_id == Book.id)
+        .where(Book.id == book_id)
+        .group_by(Book.id)
     )
-    row = stats.one()
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Book not found")
+    book = row.Book
 
     return AnalysisResponse(
         book_id=book.id,
@@ -62,13 +68,20 @@ async def get_recommendations(
         alpha=settings.recommendation_alpha,
     )
     results = await recommender.recommend(user.id, limit=10)
+    if not results:
+        return RecommendationsResponse(recommendations=[])
+
+    # Fetch all recommended books in one round-trip instead of one per result
+    book_result = await session.execute(
+        select(Book)
+        .options(load_only(Book.id, Book.title, Book.author))
+        .where(Book.id.in_([rec.book_id for rec in results]))
+    )
+    books = {book.id: book for book in book_result.scalars()}
 
     items: list[RecommendationItem] = []
     for rec in results:
-        book_result = await session.execute(
-            select(Book).where(Book.id == rec.book_id)
-        )
-        book = book_result.scalar_one_or_none()
+        book = books.get(rec.book_id)
         if book:
             items.append(
                 RecommendationItem(
@@ -90,21 +103,20 @@ async def update_preferences(
     user: User = Depends(get_current_user),
 ) -> PreferencesResponse:
     """Update user's explicit genre/author preferences for recommendations."""
+    # Single atomic upsert: one round-trip, no SELECT-then-INSERT race
+    stmt = insert(UserPreference).values(
+        user_id=user.id,
+        favorite_genres=data.favorite_genres,
+        favorite_authors=data.favorite_authors,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserPreference.user_id],
+        set_={
+            "favorite_genres": stmt.excluded.favorite_genres,
+            "favorite_authors": stmt.excluded.favorite_authors,
+        },
+    ).returning(UserPreference)
     result = await session.execute(
-        select(UserPreference).where(UserPreference.user_id == user.id)
+        stmt, execution_options={"populate_existing": True}
     )
-    prefs = result.scalar_one_or_none()
-
-    if prefs:
-        prefs.favorite_genres = data.favorite_genres
-        prefs.favorite_authors = data.favorite_authors
-    else:
-        prefs = UserPreference(
-            user_id=user.id,
-            favorite_genres=data.favorite_genres,
-            favorite_authors=data.favorite_authors,
-        )
-        session.add(prefs)
-
-    await session.flush()
-    return PreferencesResponse.model_validate(prefs)
+    return PreferencesResponse.model_validate(result.scalar_one())
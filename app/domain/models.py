@@ -1,20 +1,21 @@
 """SQLAlchemy ORM models."""
 
+import enum
 import uuid
-from datetime import datetime
 
 from sqlalchemy import (
     ARRAY,
     Column,
     DateTime,
-    Enum,
+    FetchedValue,
     Float,
     ForeignKey,
     Integer,
     String,
     Text,
+    func,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 
@@ -22,24 +23,48 @@ class Base(DeclarativeBase):
     pass
 
 
+def _utc_now():
+    """Server-side current time as naive UTC, whatever the DB session's TimeZone."""
+    return func.timezone("UTC", func.now())
+
+
+class InteractionType(str, enum.Enum):
+    """Kinds of implicit user signal recorded in user_interactions."""
+
+    BORROW = "borrow"
+    REVIEW = "review"
+    RETURN = "return"
+
+
 class User(Base):
     __tablename__ = "users"
+    # Fetch server-generated timestamps via RETURNING on INSERT and UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
     username = Column(String(100), unique=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=_utc_now())
+    updated_at = Column(DateTime, server_default=_utc_now(), server_onupdate=FetchedValue())
 
-    borrows = relationship("Borrow", back_populates="user", lazy="selectin")
-    reviews = relationship("Review", back_populates="user", lazy="selectin")
-    preferences = relationship("UserPreference", back_populates="user", uselist=False, lazy="selectin")
-    interactions = relationship("UserInteraction", back_populates="user", lazy="selectin")
+    # Collections can grow unbounded — load them explicitly with selectinload()
+    borrows = relationship(
+        "Borrow", back_populates="user", lazy="raise_on_sql", passive_deletes=True
+    )
+    reviews = relationship(
+        "Review", back_populates="user", lazy="raise_on_sql", passive_deletes=True
+    )
+    preferences = relationship("UserPreference", back_populates="user", uselist=False, lazy="select")
+    interactions = relationship(
+        "UserInteraction", back_populates="user", lazy="raise_on_sql", passive_deletes=True
+    )
 
 
 class Book(Base):
     __tablename__ = "books"
+    # Fetch server-generated timestamps via RETURNING on INSERT and UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(500), nullable=False, index=True)
@@ -51,11 +76,15 @@ class Book(Base):
     summary = Column(Text, nullable=True)
     review_consensus = Column(Text, nullable=True)
     consensus_version = Column(Integer, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=_utc_now())
+    updated_at = Column(DateTime, server_default=_utc_now(), server_onupdate=FetchedValue())
 
-    borrows = relationship("Borrow", back_populates="book", lazy="selectin")
-    reviews = relationship("Review", back_populates="book", lazy="selectin")
+    borrows = relationship(
+        "Borrow", back_populates="book", lazy="raise_on_sql", passive_deletes=True
+    )
+    reviews = relationship(
+        "Review", back_populates="book", lazy="raise_on_sql", passive_deletes=True
+    )
 
 
 class Borrow(Base):
@@ -64,7 +93,7 @@ class Borrow(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     book_id = Column(UUID(as_uuid=True), ForeignKey("books.id", ondelete="CASCADE"), nullable=False)
-    borrowed_at = Column(DateTime, default=datetime.utcnow)
+    borrowed_at = Column(DateTime, server_default=_utc_now())
     returned_at = Column(DateTime, nullable=True)
 
     user = relationship("User", back_populates="borrows")
@@ -79,7 +108,7 @@ class Review(Base):
     book_id = Column(UUID(as_uuid=True), ForeignKey("books.id", ondelete="CASCADE"), nullable=False)
     rating = Column(Integer, nullable=False)
     text = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=_utc_now())
 
     user = relationship("User", back_populates="reviews")
     book = relationship("Book", back_populates="reviews")
@@ -100,13 +129,19 @@ class UserInteraction(Base):
     __tablename__ = "user_interactions"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    book_id = Column(UUID(as_uuid=True), ForeignKey("books.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    book_id = Column(UUID(as_uuid=True), ForeignKey("books.id", ondelete="CASCADE"), nullable=False)
     interaction_type = Column(
-        Enum("borrow", "review", "return", name="interaction_type_enum"),
+        # The migration owns the native type; store enum values, not names
+        ENUM(
+            InteractionType,
+            name="interaction_type_enum",
+            create_type=False,
+            values_callable=lambda members: [m.value for m in members],
+        ),
         nullable=False,
     )
     rating = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=_utc_now())
 
     user = relationship("User", back_populates="interactions")
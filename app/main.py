@@ -6,12 +6,15 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.adapters.registry import close_shared_adapters
 from app.api.routes.auth import router as auth_router
 from app.api.routes.books import router as books_router
 from app.api.routes.intelligence import router as intel_router
 from app.api.routes.reviews import router as reviews_router
 from app.config import settings
+from app.services.interactions import interaction_buffer
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,8 +30,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Storage backend: %s", settings.storage_backend.value)
     logger.info("LLM provider: %s", settings.llm_provider.value)
     logger.info("Recommendation alpha: %.2f", settings.recommendation_alpha)
+    interaction_buffer.start()
     yield
     logger.info("LuminaLib shutting down...")
+    try:
+        await interaction_buffer.stop()
+    finally:
+        await close_shared_adapters()
 
 
 def create_app() -> FastAPI:
@@ -38,6 +46,7 @@ def create_app() -> FastAPI:
         description="Intelligent Library System with GenAI & ML Recommendations",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # ── Middleware ──────────────────────────────────
@@ -63,4 +72,4 @@ def create_app() -> FastAPI:
     return application
 
 
-app = create_app()app/main.py
+app = create_app()
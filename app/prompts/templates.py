@@ -9,7 +9,13 @@ Design Principles:
   5. Helper functions handle formatting and rendering.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from enum import IntEnum
+from string import Formatter
+from typing import TypeVar
+
+_T = TypeVar("_T")
 
 
 # ── Token Estimation ─────────────────────────────────────────────
@@ -26,20 +32,44 @@ def estimate_tokens(text: str) -> int:
 
 def truncate_to_tokens(text: str, max_tokens: int) -> str:
     """Truncate text to approximately max_tokens."""
-    max_chars = max_tokens * CHARS_PER_TOKEN
+    return _truncate_to_chars(text, max_tokens * CHARS_PER_TOKEN)
+
+
+def _truncate_to_chars(text: str, max_chars: int) -> str:
+    """Truncate text to max_chars, preferring a sentence boundary."""
     if len(text) <= max_chars:
         return text
-    truncated = text[:max_chars]
-    # Cut at the last sentence boundary to avoid mid-sentence truncation
-    last_period = truncated.rfind(".")
-    if last_period > max_chars * 0.8:
-        truncated = truncated[: last_period + 1]
+    # Cut at the last sentence boundary to avoid mid-sentence truncation,
+    # searching only the final 20% of the kept prefix
+    last_period = text.rfind(".", int(max_chars * 0.8) + 1, max_chars)
+    if last_period != -1:
+        truncated = text[: last_period + 1]
+    else:
+        truncated = text[:max_chars]
     return truncated + "\n\n[Content truncated for processing]"
 
 
 # ── Prompt Template ──────────────────────────────────────────────
 
-@dataclass(frozen=True)
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """
+    Parse a str.format template once into (literal, field_name) pairs.
+
+    Rendering then only concatenates, instead of re-scanning the format
+    string on every call. Only plain {name} placeholders are supported.
+    """
+    compiled = []
+    for literal, name, spec, conversion in Formatter().parse(template):
+        if spec or conversion or (name is not None and not name.isidentifier()):
+            raise ValueError(
+                f"Unsupported placeholder {{{name}}} in prompt template; "
+                "use plain {name} fields"
+            )
+        compiled.append((literal, name))
+    return tuple(compiled)
+
+
+@dataclass(frozen=True, slots=True)
 class PromptTemplate:
     """
     Immutable prompt template with system persona and user message.
@@ -61,19 +91,35 @@ class PromptTemplate:
     max_tokens: int = 1024
     input_token_limit: int = 4000
     tags: tuple[str, ...] = field(default_factory=tuple)
+    _input_char_limit: int = field(init=False, repr=False, compare=False)
+    _compiled: tuple[tuple[str, str | None], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Frozen: derived values must be set through object.__setattr__
+        object.__setattr__(
+            self, "_input_char_limit", self.input_token_limit * CHARS_PER_TOKEN
+        )
+        object.__setattr__(self, "_compiled", _compile_template(self.user_template))
 
     def render(self, **kwargs: str) -> dict[str, str]:
         """Render template with variables, returning system + user messages."""
+        parts: list[str] = []
+        for literal, name in self._compiled:
+            parts.append(literal)
+            if name is not None:
+                parts.append(str(kwargs[name]))
         return {
             "system": self.system,
-            "user": self.user_template.format(**kwargs),
+            "user": "".join(parts),
         }
 
     def render_with_truncation(self, content_key: str, **kwargs: str) -> dict[str, str]:
         """Render template, truncating the specified content field to fit token limits."""
         if content_key in kwargs:
-            kwargs[content_key] = truncate_to_tokens(
-                kwargs[content_key], self.input_token_limit
+            kwargs[content_key] = _truncate_to_chars(
+                kwargs[content_key], self._input_char_limit
             )
         return self.render(**kwargs)
 
@@ -138,6 +184,42 @@ ANALYZE_REVIEWS = PromptTemplate(
     tags=("sentiment", "reviews", "consensus"),
 )
 
+# Output budget for each per-chunk partial consensus in map-reduce analysis
+REVIEW_CHUNK_MAX_TOKENS = 300
+
+
+# ── Consensus Merge Prompt ───────────────────────────────────────
+
+MERGE_REVIEW_CONSENSUS = PromptTemplate(
+    name="merge_review_consensus",
+    version="1.0.0",
+    system=(
+        "You are a sentiment analysis expert specializing in literary reviews. "
+        "You are given several partial consensus summaries, each written from a "
+        "different batch of reader reviews for the same book. Your task is to "
+        "merge them into one balanced, nuanced consensus.\n\n"
+        "Guidelines:\n"
+        "- Produce 2-3 paragraphs.\n"
+        "- Weigh points that recur across batches more heavily than one-off remarks.\n"
+        "- Note the overall sentiment (positive, mixed, negative) with nuance.\n"
+        "- Highlight commonly praised strengths and commonly cited weaknesses.\n"
+        "- Conclude with who would likely enjoy this book.\n"
+        "- If a previous consensus exists, update it — don't start from scratch."
+    ),
+    user_template=(
+        "{previous_consensus_section}"
+        "Below are partial consensus summaries, each covering a different batch "
+        "of reader reviews for this book:\n\n"
+        "--- PARTIAL SUMMARIES (START) ---\n"
+        "{partials_text}\n"
+        "--- PARTIAL SUMMARIES (END) ---\n\n"
+        "Merge these into a single updated consensus summary:"
+    ),
+    max_tokens=512,
+    input_token_limit=3000,
+    tags=("sentiment", "reviews", "consensus", "merge"),
+)
+
 
 # ── Rendering Helpers ────────────────────────────────────────────
 
@@ -163,39 +245,148 @@ def render_review_consensus_prompt(
     Returns:
         Dict with 'system' and 'user' keys ready for any LLM adapter.
     """
+    # List comprehension, not a genexp: join() materializes its input anyway
     reviews_text = "\n\n".join(
-        f"[Rating: {r['rating']}/5]\n{r['text']}" for r in reviews
+        [f"[Rating: {r['rating']}/5]\n{r['text']}" for r in reviews]
     )
 
-    previous_section = ""
-    if current_consensus:
-        previous_section = (
-            "--- PREVIOUS CONSENSUS (START) ---\n"
-            f"{current_consensus}\n"
-            "--- PREVIOUS CONSENSUS (END) ---\n\n"
-            "Update the above consensus with the new reviews below.\n\n"
-        )
-
     return ANALYZE_REVIEWS.render_with_truncation(
         content_key="reviews_text",
         reviews_text=reviews_text,
-        previous_consensus_section=previous_section,
+        previous_consensus_section=_previous_consensus_section(current_consensus),
+    )
+
+
+def _batch_by_tokens(
+    items: list[_T], cost: Callable[[_T], int], max_tokens: int
+) -> list[list[_T]]:
+    """Split items into consecutive batches whose summed cost fits max_tokens."""
+    batches: list[list[_T]] = []
+    current: list[_T] = []
+    used = 0
+    for item in items:
+        item_cost = cost(item)
+        if current and used + item_cost > max_tokens:
+            batches.append(current)
+            current = []
+            used = 0
+        current.append(item)
+        used += item_cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def chunk_reviews(
+    reviews: list[dict],
+    max_tokens: int = ANALYZE_REVIEWS.input_token_limit,
+) -> list[list[dict]]:
+    """
+    Split reviews into consecutive batches that each fit the consensus prompt.
+
+    Used to map-reduce large review sets instead of truncating them.
+    """
+    # +5 tokens for the "[Rating: n/5]" header and separator
+    return _batch_by_tokens(
+        reviews, lambda r: len(r["text"]) // CHARS_PER_TOKEN + 5, max_tokens
+    )
+
+
+def chunk_partials(
+    partials: list[str],
+    max_tokens: int = MERGE_REVIEW_CONSENSUS.input_token_limit,
+) -> list[list[str]]:
+    """Split partial consensuses into groups that each fit one merge prompt."""
+    # +5 tokens for the "[Batch n]" header and separator
+    return _batch_by_tokens(
+        partials, lambda p: len(p) // CHARS_PER_TOKEN + 5, max_tokens
     )
 
 
+def render_consensus_merge_prompt(
+    partials: list[str],
+    current_consensus: str | None = None,
+) -> dict[str, str]:
+    """
+    Render the prompt that merges per-batch partial consensuses.
+
+    Args:
+        partials: Partial consensus texts, one per review batch.
+        current_consensus: Existing consensus text to update, or None.
+
+    Returns:
+        Dict with 'system' and 'user' keys ready for any LLM adapter.
+
+    Raises:
+        ValueError: If the partials exceed the merge input limit. Truncating
+            would silently drop whole review batches, so callers must group
+            them with chunk_partials() and merge in rounds instead.
+    """
+    partials_text = "\n\n".join(
+        [f"[Batch {i}]\n{partial}" for i, partial in enumerate(partials, start=1)]
+    )
+    if len(partials_text) > MERGE_REVIEW_CONSENSUS._input_char_limit:
+        raise ValueError(
+            f"{len(partials)} partial consensuses exceed the "
+            f"{MERGE_REVIEW_CONSENSUS.input_token_limit}-token merge limit"
+        )
+    return MERGE_REVIEW_CONSENSUS.render(
+        partials_text=partials_text,
+        previous_consensus_section=_previous_consensus_section(current_consensus),
+    )
+
+
+_PREV_CONSENSUS_PREFIX = "--- PREVIOUS CONSENSUS (START) ---\n"
+_PREV_CONSENSUS_SUFFIX = (
+    "\n--- PREVIOUS CONSENSUS (END) ---\n\n"
+    "Update the above consensus with the new reviews below.\n\n"
+)
+
+
+def _previous_consensus_section(current_consensus: str | None) -> str:
+    """Build the optional 'previous consensus' block for consensus prompts."""
+    if not current_consensus:
+        return ""
+    return _PREV_CONSENSUS_PREFIX + current_consensus + _PREV_CONSENSUS_SUFFIX
+
+
 # ── Prompt Registry ──────────────────────────────────────────────
 # Central registry for discoverability, logging, and future API exposure.
 
 PROMPT_REGISTRY: dict[str, PromptTemplate] = {
     SUMMARIZE_BOOK.name: SUMMARIZE_BOOK,
     ANALYZE_REVIEWS.name: ANALYZE_REVIEWS,
+    MERGE_REVIEW_CONSENSUS.name: MERGE_REVIEW_CONSENSUS,
 }
 
+# The registry is static, so the error-message listing is built once
+_AVAILABLE_PROMPTS = ", ".join(PROMPT_REGISTRY)
+
 
 def get_prompt(name: str) -> PromptTemplate:
     """Retrieve a prompt template by name. Raises KeyError if not found."""
-    if name not in PROMPT_REGISTRY:
+    try:
+        return PROMPT_REGISTRY[name]
+    except KeyError:
         raise KeyError(
-            f"Prompt '{name}' not found. Available: {list(PROMPT_REGISTRY.keys())}"
-        )
-    return PROMPT_REGISTRY[name]
+            f"Prompt '{name}' not found. Available: {_AVAILABLE_PROMPTS}"
+        ) from None
+
+
+class PromptID(IntEnum):
+    """Integer ids for callers that know their prompt statically."""
+
+    SUMMARIZE_BOOK = 0
+    ANALYZE_REVIEWS = 1
+    MERGE_REVIEW_CONSENSUS = 2
+
+
+# Indexed by PromptID; built from the enum so the two can't drift apart
+_PROMPTS: tuple[PromptTemplate, ...] = tuple(
+    PROMPT_REGISTRY[prompt_id.name.lower()] for prompt_id in sorted(PromptID)
+)
+
+
+def get_prompt_by_id(prompt_id: PromptID) -> PromptTemplate:
+    """Retrieve a prompt template by id (tuple index, no string hashing)."""
+    return _PROMPTS[prompt_id]
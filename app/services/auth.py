@@ -1,7 +1,8 @@
 """Authentication and user lifecycle service."""
 
 from fastapi import HTTPException, status
-from sqlalchemy import or_, select
+from sqlalchemy import exists, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.middleware.auth import create_access_token, hash_password, verify_password
@@ -9,6 +10,13 @@ from app.api.schemas import SignupRequest
 from app.domain.models import User
 
 
+def _already_registered() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Email or username already registered",
+    )
+
+
 class AuthService:
     """Handles user registration, authentication, and profile retrieval."""
 
@@ -17,24 +25,30 @@ class AuthService:
 
     async def signup(self, data: SignupRequest) -> User:
         """Register a new user. Raises 409 if email or username exists."""
-        existing = await self._session.execute(
-            select(User).where(
-                or_(User.email == data.email, User.username == data.username)
+        # EXISTS probe first, so a duplicate is rejected without paying for
+        # the password hash
+        taken = await self._session.scalar(
+            select(
+                exists().where(
+                    or_(User.email == data.email, User.username == data.username)
+                )
             )
         )
-        if existing.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Email or username already registered",
-            )
+        if taken:
+            raise _already_registered()
 
         user = User(
             email=data.email,
             username=data.username,
             hashed_password=hash_password(data.password),
         )
+        # The UNIQUE constraints still catch a concurrent signup that slipped
+        # past the probe
         self._session.add(user)
-        await self._session.flush()
+        try:
+            await self._session.flush()
+        except IntegrityError:
+            raise _already_registered() from None
         return user
 
     async def login(self, email: str, password: str) -> str:
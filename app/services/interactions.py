@@ -0,0 +1,180 @@
+"""Buffered writer for implicit user-interaction signals."""
+
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy import event, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.database import async_session_factory
+from app.domain.models import InteractionType, UserInteraction
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel telling the flusher to write its current batch and exit
+_STOP: dict = {}
+
+# Session.info key for interactions waiting on their transaction to commit
+_PENDING_KEY = "pending_interactions"
+
+
+def _row(
+    user_id: UUID,
+    book_id: UUID,
+    interaction_type: InteractionType,
+    rating: float | None,
+) -> dict:
+    return {
+        "user_id": user_id,
+        "book_id": book_id,
+        "interaction_type": interaction_type,
+        "rating": rating,
+    }
+
+
+class InteractionBuffer:
+    """
+    Collects user interactions in memory and writes them in batches.
+
+    Interactions are ML signals, not transactional data: callers enqueue
+    them without a round-trip, and a background task flushes them as one
+    multi-row INSERT every `flush_interval` seconds or `max_batch` rows.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_batch: int = 1000,
+        flush_interval: float = 0.5,
+    ) -> None:
+        self._session_factory = session_factory
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue[dict] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def record(
+        self,
+        user_id: UUID,
+        book_id: UUID,
+        interaction_type: InteractionType,
+        rating: float | None = None,
+    ) -> None:
+        """Enqueue an interaction for the next batch write."""
+        self._queue.put_nowait(_row(user_id, book_id, interaction_type, rating))
+
+    def record_after_commit(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        book_id: UUID,
+        interaction_type: InteractionType,
+        rating: float | None = None,
+    ) -> None:
+        """
+        Enqueue an interaction once the session's transaction commits.
+
+        The row is held on the session and discarded if the transaction rolls
+        back, so the flusher never writes a signal for data that was never
+        committed (e.g. a review whose request failed after the INSERT).
+        """
+        sync_session = session.sync_session
+        pending = sync_session.info.get(_PENDING_KEY)
+        if pending is None:
+            pending = sync_session.info[_PENDING_KEY] = []
+            event.listen(sync_session, "after_commit", self._enqueue_pending)
+            event.listen(sync_session, "after_rollback", self._discard_pending)
+        pending.append(_row(user_id, book_id, interaction_type, rating))
+
+    def _enqueue_pending(self, session: Session) -> None:
+        # Savepoint release/rollback fire these events too; only the
+        # outermost transaction decides whether the rows happened
+        if session.get_nested_transaction() is not None:
+            return
+        pending = session.info[_PENDING_KEY]
+        for row in pending:
+            self._queue.put_nowait(row)
+        pending.clear()
+
+    def _discard_pending(self, session: Session) -> None:
+        if session.get_nested_transaction() is not None:
+            return
+        session.info[_PENDING_KEY].clear()
+
+    def start(self) -> None:
+        """Start the background flusher."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write any pending interactions."""
+        if self._task is not None:
+            self._queue.put_nowait(_STOP)
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write everything currently queued."""
+        rows: list[dict] = []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        for start in range(0, len(rows), self._max_batch):
+            await self._write(rows[start : start + self._max_batch])
+
+    async def _run(self) -> None:
+        """Wait for the first row, then collect until the batch or window fills."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            row = await self._queue.get()
+            if row is _STOP:
+                return
+            batch = [row]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is _STOP:
+                    stopping = True
+                    break
+                batch.append(row)
+            try:
+                await self._write(batch)
+            except Exception:
+                logger.exception("Failed to write %d user interactions", len(batch))
+
+    async def _write(self, rows: list[dict]) -> None:
+        """
+        Insert a batch of interactions in a single executemany statement.
+
+        If the batch violates a constraint (e.g. its user or book was deleted
+        while the row sat in the queue), split it and retry each half, so only
+        the offending rows are dropped.
+        """
+        if not rows:
+            return
+        try:
+            async with self._session_factory() as session:
+                await session.execute(insert(UserInteraction), rows)
+                await session.commit()
+        except IntegrityError:
+            if len(rows) == 1:
+                logger.warning("Dropped user interaction: %s", rows[0], exc_info=True)
+                return
+            middle = len(rows) // 2
+            await self._write(rows[:middle])
+            await self._write(rows[middle:])
+            return
+        logger.debug("Wrote %d user interactions", len(rows))
+
+
+interaction_buffer = InteractionBuffer(async_session_factory)
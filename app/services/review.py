@@ -1,13 +1,18 @@
 """Review submission service with borrow constraint enforcement."""
 
-from uuid import UUID
+from datetime import datetime
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import exists, insert, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import ReviewCreateRequest
-from app.domain.models import Borrow, Review, UserInteraction
+from app.domain.models import Borrow, InteractionType, Review
+from app.services.interactions import interaction_buffer
+
+# Position after the last review of a page: (created_at, id)
+ReviewCursor = tuple[datetime, UUID]
 
 
 class ReviewService:
@@ -25,34 +30,39 @@ class ReviewService:
         Constraint: The user must have borrowed the book (active or returned).
         Raises 403 if the user has never borrowed this book.
         """
-        borrow_result = await self._session.execute(
-            select(Borrow).where(
-                Borrow.book_id == book_id,
-                Borrow.user_id == user_id,
-            )
+        # Insert only if the user has a borrow for this book: the constraint
+        # check and the INSERT share one round-trip.
+        has_borrowed = exists().where(
+            Borrow.book_id == book_id,
+            Borrow.user_id == user_id,
+        )
+        source = select(
+            literal(uuid4(), Review.id.type),
+            literal(user_id, Review.user_id.type),
+            literal(book_id, Review.book_id.type),
+            literal(data.rating, Review.rating.type),
+            literal(data.text, Review.text.type),
+        ).where(has_borrowed)
+        result = await self._session.execute(
+            insert(Review)
+            .from_select(["id", "user_id", "book_id", "rating", "text"], source)
+            .returning(Review)
         )
-        if not borrow_result.scalar_one_or_none():
+        review = result.scalar_one_or_none()
+        if review is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You must borrow a book before reviewing it",
             )
 
-        review = Review(
-            user_id=user_id,
-            book_id=book_id,
-            rating=data.rating,
-            text=data.text,
-        )
-        self._session.add(review)
-
-        interaction = UserInteraction(
+        # Queued only once the request's transaction commits
+        interaction_buffer.record_after_commit(
+            self._session,
             user_id=user_id,
             book_id=book_id,
-            interaction_type="review",
+            interaction_type=InteractionType.REVIEW,
             rating=float(data.rating),
         )
-        self._session.add(interaction)
-        await self._session.flush()
         return review
 
     async def get_reviews_for_book(self, book_id: UUID) -> list[Review]:
@@ -60,6 +70,33 @@ class ReviewService:
         result = await self._session.execute(
             select(Review)
             .where(Review.book_id == book_id)
-            .order_by(Review.created_at.desc())
+            .order_by(Review.created_at.desc(), Review.id.desc())
         )
         return list(result.scalars().all())
+
+    async def get_reviews_page(
+        self,
+        book_id: UUID,
+        cursor: ReviewCursor | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Review], ReviewCursor | None]:
+        """
+        Retrieve one page of a book's reviews, newest first.
+
+        Keyset pagination on (created_at, id): timestamps tie for reviews
+        written in the same transaction, so the id breaks ties and no review
+        is skipped at a page boundary. Pass the returned cursor back to fetch
+        the next page; it is None when there are no more reviews.
+        """
+        stmt = select(Review).where(Review.book_id == book_id)
+        if cursor is not None:
+            stmt = stmt.where(tuple_(Review.created_at, Review.id) < cursor)
+        # Fetch one extra row to know whether another page exists
+        result = await self._session.execute(
+            stmt.order_by(Review.created_at.desc(), Review.id.desc()).limit(limit + 1)
+        )
+        items = list(result.scalars().all())
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, (items[-1].created_at, items[-1].id)
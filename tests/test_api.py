@@ -11,9 +11,14 @@ from app.main import app
 BASE = "http://test"
 
 
+@pytest.fixture(scope="session")
+def transport() -> ASGITransport:
+    """One ASGI transport for the whole run; clients stay per-test."""
+    return ASGITransport(app=app)
+
+
 @pytest.fixture
-async def client():
-    transport = ASGITransport(app=app)
+async def client(transport: ASGITransport, setup_db):
     async with AsyncClient(transport=transport, base_url=BASE) as c:
         yield c
 
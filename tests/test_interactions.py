@@ -0,0 +1,169 @@
+"""Unit tests for the buffered user-interaction writer."""
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import String, cast, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import Book, InteractionType, User, UserInteraction
+from app.services.interactions import InteractionBuffer
+
+
+class FakeSession:
+    """Stands in for an AsyncSession, recording each executemany batch."""
+
+    def __init__(
+        self, writes: list[list[dict]], rejected_users: frozenset[UUID] = frozenset()
+    ) -> None:
+        self._writes = writes
+        self._rejected_users = rejected_users
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def execute(self, statement, rows: list[dict]) -> None:
+        if any(row["user_id"] in self._rejected_users for row in rows):
+            raise IntegrityError("INSERT", None, Exception("foreign key violation"))
+        self._writes.append(list(rows))
+
+    async def commit(self) -> None:
+        pass
+
+
+def make_buffer(
+    writes: list[list[dict]],
+    rejected_users: frozenset[UUID] = frozenset(),
+    **kwargs,
+) -> InteractionBuffer:
+    return InteractionBuffer(lambda: FakeSession(writes, rejected_users), **kwargs)
+
+
+def record_many(buffer: InteractionBuffer, count: int) -> None:
+    for _ in range(count):
+        buffer.record(uuid4(), uuid4(), InteractionType.BORROW)
+
+
+# ── Batching ───────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_written_without_waiting_for_window():
+    writes: list[list[dict]] = []
+    buffer = make_buffer(writes, max_batch=3, flush_interval=60)
+    buffer.start()
+
+    record_many(buffer, 7)
+    await asyncio.sleep(0.05)
+    assert [len(batch) for batch in writes] == [3, 3]
+
+    await buffer.stop()
+    assert [len(batch) for batch in writes] == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_written_when_window_closes():
+    writes: list[list[dict]] = []
+    buffer = make_buffer(writes, max_batch=1000, flush_interval=0.05)
+    buffer.start()
+
+    record_many(buffer, 2)
+    await asyncio.sleep(0.2)
+    assert [len(batch) for batch in writes] == [2]
+
+    await buffer.stop()
+    assert [len(batch) for batch in writes] == [2]
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_pending_rows():
+    writes: list[list[dict]] = []
+    buffer = make_buffer(writes, max_batch=1000, flush_interval=60)
+    buffer.start()
+
+    record_many(buffer, 5)
+    await buffer.stop()
+    assert sum(len(batch) for batch in writes) == 5
+
+
+@pytest.mark.asyncio
+async def test_constraint_violation_drops_only_offending_rows():
+    writes: list[list[dict]] = []
+    deleted_user = uuid4()
+    buffer = make_buffer(writes, rejected_users=frozenset({deleted_user}))
+
+    record_many(buffer, 4)
+    buffer.record(deleted_user, uuid4(), InteractionType.BORROW)
+    record_many(buffer, 2)
+    await buffer.flush()
+
+    written = [row for batch in writes for row in batch]
+    assert len(written) == 6
+    assert all(row["user_id"] != deleted_user for row in written)
+
+
+# ── Transaction Awareness ──────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_record_after_commit_waits_for_commit(db_session: AsyncSession):
+    writes: list[list[dict]] = []
+    buffer = make_buffer(writes)
+    await db_session.execute(select(1))
+
+    buffer.record_after_commit(db_session, uuid4(), uuid4(), InteractionType.REVIEW)
+    await buffer.flush()
+    assert writes == []
+
+    await db_session.commit()
+    await buffer.flush()
+    assert [len(batch) for batch in writes] == [1]
+
+
+@pytest.mark.asyncio
+async def test_record_after_commit_drops_rows_on_rollback(db_session: AsyncSession):
+    writes: list[list[dict]] = []
+    buffer = make_buffer(writes)
+    await db_session.execute(select(1))
+
+    buffer.record_after_commit(db_session, uuid4(), uuid4(), InteractionType.REVIEW)
+    await db_session.rollback()
+    await db_session.commit()
+    await buffer.flush()
+    assert writes == []
+
+
+# ── Storage ────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_interaction_type_round_trips_as_lowercase_value(db_session: AsyncSession):
+    user = User(
+        email=f"signal_{uuid4().hex[:8]}@example.com",
+        username=f"signal_{uuid4().hex[:8]}",
+        hashed_password="x",
+    )
+    book = Book(title="Signal", author="Author", file_path="signal.txt", file_type="txt")
+    db_session.add_all([user, book])
+    await db_session.flush()
+    interaction = UserInteraction(
+        user_id=user.id, book_id=book.id, interaction_type=InteractionType.REVIEW
+    )
+    db_session.add(interaction)
+    await db_session.flush()
+
+    stored = await db_session.scalar(
+        select(cast(UserInteraction.interaction_type, String)).where(
+            UserInteraction.id == interaction.id
+        )
+    )
+    assert stored == "review"
+
+    db_session.expire(interaction)
+    await db_session.refresh(interaction)
+    assert interaction.interaction_type is InteractionType.REVIEW
@@ -0,0 +1,157 @@
+"""Unit tests for the caching / request-coalescing LLM decorator."""
+
+import asyncio
+import gc
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+from cachetools import TTLCache
+
+from app.adapters.llm import cached
+from app.adapters.llm.cached import CachedLLMAdapter
+
+
+class FakeLLM:
+    """Counts calls; optionally blocks on a gate or fails once released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.gate: asyncio.Event | None = None
+        self.fail = False
+
+    async def summarize_book(self, text: str) -> str:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("provider down")
+        return f"summary of {text}"
+
+    async def analyze_reviews(
+        self, reviews: list[dict], current_consensus: str | None
+    ) -> str:
+        self.calls += 1
+        return f"consensus of {len(reviews)}"
+
+
+def make_adapter(inner: FakeLLM) -> CachedLLMAdapter:
+    # Unique namespace: the in-flight map is process-wide
+    return CachedLLMAdapter(
+        inner, namespace=f"test-{uuid4().hex}", cache=TTLCache(maxsize=64, ttl=60)
+    )
+
+
+# ── Caching ────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_repeat_call_is_served_from_cache():
+    inner = FakeLLM()
+    adapter = make_adapter(inner)
+
+    assert await adapter.summarize_book("book") == "summary of book"
+    assert await adapter.summarize_book("book") == "summary of book"
+    assert inner.calls == 1
+
+    await adapter.summarize_book("another book")
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_template_version_bump_misses_cache(monkeypatch: pytest.MonkeyPatch):
+    inner = FakeLLM()
+    adapter = make_adapter(inner)
+    await adapter.summarize_book("book")
+
+    monkeypatch.setattr(
+        cached, "SUMMARIZE_BOOK", replace(cached.SUMMARIZE_BOOK, version="99.0.0")
+    )
+    await adapter.summarize_book("book")
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_merge_template_version_bump_misses_consensus_cache(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    inner = FakeLLM()
+    adapter = make_adapter(inner)
+    reviews = [{"rating": 5, "text": "Loved it"}]
+    await adapter.analyze_reviews(reviews, None)
+    await adapter.analyze_reviews(reviews, None)
+    assert inner.calls == 1
+
+    monkeypatch.setattr(
+        cached,
+        "MERGE_REVIEW_CONSENSUS",
+        replace(cached.MERGE_REVIEW_CONSENSUS, version="99.0.0"),
+    )
+    await adapter.analyze_reviews(reviews, None)
+    assert inner.calls == 2
+
+
+# ── Coalescing ─────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_inner_call():
+    inner = FakeLLM()
+    inner.gate = asyncio.Event()
+    adapter = make_adapter(inner)
+
+    waiters = [asyncio.create_task(adapter.summarize_book("book")) for _ in range(5)]
+    await asyncio.sleep(0)
+    inner.gate.set()
+
+    assert await asyncio.gather(*waiters) == ["summary of book"] * 5
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_does_not_cancel_the_others():
+    inner = FakeLLM()
+    inner.gate = asyncio.Event()
+    adapter = make_adapter(inner)
+
+    first = asyncio.create_task(adapter.summarize_book("book"))
+    second = asyncio.create_task(adapter.summarize_book("book"))
+    await asyncio.sleep(0)
+    first.cancel()
+    inner.gate.set()
+
+    assert await second == "summary of book"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_with_no_waiters_left_is_retrieved():
+    inner = FakeLLM()
+    inner.gate = asyncio.Event()
+    inner.fail = True
+    adapter = make_adapter(inner)
+    unhandled: list[dict] = []
+    loop = asyncio.get_running_loop()
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+    try:
+        waiter = asyncio.create_task(adapter.summarize_book("book"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        # Fail only after the last waiter has gone away
+        inner.gate.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(previous_handler)
+
+    assert unhandled == []
+    # The failure was not cached, so the next call retries
+    inner.gate = None
+    inner.fail = False
+    assert await adapter.summarize_book("book") == "summary of book"
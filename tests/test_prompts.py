@@ -0,0 +1,118 @@
+"""Unit tests for prompt rendering and map-reduce review consensus."""
+
+import re
+
+import pytest
+
+from app.adapters.llm.consensus import analyze_reviews_map_reduce
+from app.prompts.templates import (
+    ANALYZE_REVIEWS,
+    MERGE_REVIEW_CONSENSUS,
+    REVIEW_CHUNK_MAX_TOKENS,
+    chunk_partials,
+    chunk_reviews,
+    render_consensus_merge_prompt,
+)
+
+TRUNCATION_MARKER = "[Content truncated for processing]"
+
+
+def make_reviews(count: int, length: int = 400) -> list[dict]:
+    return [
+        {"rating": i % 5 + 1, "text": f"review-{i} " + "x" * length}
+        for i in range(count)
+    ]
+
+
+# ── Chunking ───────────────────────────────────────
+
+
+def test_chunk_reviews_small_set_is_one_chunk():
+    reviews = make_reviews(3)
+    assert chunk_reviews(reviews) == [reviews]
+
+
+def test_chunk_reviews_keeps_order_and_respects_limit():
+    reviews = make_reviews(300)
+    chunks = chunk_reviews(reviews)
+    assert len(chunks) > 1
+    assert [r for chunk in chunks for r in chunk] == reviews
+    for chunk in chunks:
+        cost = sum(len(r["text"]) // 4 + 5 for r in chunk)
+        assert cost <= ANALYZE_REVIEWS.input_token_limit
+
+
+def test_chunk_reviews_oversized_review_gets_own_chunk():
+    reviews = make_reviews(2, length=ANALYZE_REVIEWS.input_token_limit * 8)
+    assert chunk_reviews(reviews) == [[reviews[0]], [reviews[1]]]
+
+
+def test_chunk_partials_groups_fit_merge_prompt():
+    partials = ["p" * REVIEW_CHUNK_MAX_TOKENS * 4] * 100
+    groups = chunk_partials(partials)
+    assert len(groups) > 1
+    assert sum(len(g) for g in groups) == 100
+    for group in groups:
+        render_consensus_merge_prompt(group)  # must not raise
+
+
+# ── Merge Prompt ───────────────────────────────────
+
+
+def test_merge_prompt_includes_every_partial():
+    prompt = render_consensus_merge_prompt(["alpha", "beta", "gamma"], "old")
+    assert prompt["system"] == MERGE_REVIEW_CONSENSUS.system
+    assert "[Batch 1]\nalpha" in prompt["user"]
+    assert "[Batch 3]\ngamma" in prompt["user"]
+    assert "old" in prompt["user"]
+
+
+def test_merge_prompt_refuses_to_truncate():
+    partials = ["p" * REVIEW_CHUNK_MAX_TOKENS * 4] * 100
+    with pytest.raises(ValueError):
+        render_consensus_merge_prompt(partials)
+
+
+# ── Map-Reduce ─────────────────────────────────────
+
+
+class RecordingLLM:
+    """Fake completion call that tracks which reviews each partial covers."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int]] = []
+        self.coverage: dict[str, set[int]] = {}
+
+    async def generate(self, system: str, user: str, max_tokens: int) -> str:
+        self.calls.append((user, max_tokens))
+        assert TRUNCATION_MARKER not in user
+        covered = {int(i) for i in re.findall(r"review-(\d+)", user)}
+        for partial_id in re.findall(r"partial-\d+", user):
+            covered |= self.coverage[partial_id]
+        partial_id = f"partial-{len(self.coverage)}"
+        self.coverage[partial_id] = covered
+        # Pad to roughly the real per-chunk output size
+        return f"{partial_id} " + "s" * REVIEW_CHUNK_MAX_TOKENS * 3
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_single_chunk_is_one_call():
+    llm = RecordingLLM()
+    await analyze_reviews_map_reduce(llm.generate, make_reviews(3), None)
+    assert len(llm.calls) == 1
+    assert llm.calls[0][1] == ANALYZE_REVIEWS.max_tokens
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_large_set_covers_every_review():
+    reviews = make_reviews(3000)
+    llm = RecordingLLM()
+
+    result = await analyze_reviews_map_reduce(llm.generate, reviews, "previous")
+
+    assert llm.coverage[result.split()[0]] == set(range(len(reviews)))
+    final_user, final_max_tokens = llm.calls[-1]
+    assert final_max_tokens == MERGE_REVIEW_CONSENSUS.max_tokens
+    assert "previous" in final_user
+    # Only the final merge sees the previous consensus
+    assert not any("previous" in user for user, _ in llm.calls[:-1])
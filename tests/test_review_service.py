@@ -0,0 +1,86 @@
+"""Service-level tests for review submission and pagination."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas import ReviewCreateRequest
+from app.domain.models import Book, Borrow, InteractionType, Review, User, UserInteraction
+from app.services.interactions import interaction_buffer
+from app.services.review import ReviewService
+
+
+@pytest.mark.asyncio
+async def test_committed_review_is_recorded_as_interaction(db_session: AsyncSession):
+    user = User(
+        email=f"critic_{uuid4().hex[:8]}@example.com",
+        username=f"critic_{uuid4().hex[:8]}",
+        hashed_password="x",
+    )
+    book = Book(title="Signal", author="Author", file_path="signal.txt", file_type="txt")
+    db_session.add_all([user, book])
+    await db_session.flush()
+    db_session.add(Borrow(user_id=user.id, book_id=book.id))
+    await db_session.commit()
+
+    await ReviewService(db_session).create_review(
+        book.id, user.id, ReviewCreateRequest(rating=4, text="Worth it")
+    )
+    await db_session.commit()
+    await interaction_buffer.flush()
+
+    interaction = await db_session.scalar(
+        select(UserInteraction).where(
+            UserInteraction.user_id == user.id, UserInteraction.book_id == book.id
+        )
+    )
+    assert interaction is not None
+    assert interaction.interaction_type is InteractionType.REVIEW
+    assert interaction.rating == 4.0
+
+
+@pytest.mark.asyncio
+async def test_review_pages_do_not_skip_tied_timestamps(db_session: AsyncSession):
+    user = User(
+        email=f"pager_{uuid4().hex[:8]}@example.com",
+        username=f"pager_{uuid4().hex[:8]}",
+        hashed_password="x",
+    )
+    book = Book(title="Paged", author="Author", file_path="paged.txt", file_type="txt")
+    db_session.add_all([user, book])
+    await db_session.flush()
+
+    # Reviews inserted in one transaction share created_at
+    tied_at = datetime(2024, 1, 1, 12, 0, 0)
+    reviews = [
+        Review(user_id=user.id, book_id=book.id, rating=5, text=f"r{i}", created_at=tied_at)
+        for i in range(5)
+    ]
+    reviews.append(
+        Review(
+            user_id=user.id,
+            book_id=book.id,
+            rating=3,
+            text="older",
+            created_at=datetime(2023, 1, 1),
+        )
+    )
+    db_session.add_all(reviews)
+    await db_session.flush()
+
+    service = ReviewService(db_session)
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = await service.get_reviews_page(book.id, cursor, limit=2)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert len(seen) == len(reviews)
+    assert {r.id for r in seen} == {r.id for r in reviews}
+    assert seen[-1].text == "older"
+    assert seen == await service.get_reviews_for_book(book.id)